@@ -0,0 +1,49 @@
+-- dbt Build Cost Analysis
+-- Compares bytes processed and build time per model across dbt runs, e.g. the
+-- last full refresh (`dbt build --full-refresh`) against the incremental runs after it.
+-- Relies on `query-comment: job-label: true` in dbt_project.yml, which tags every
+-- BigQuery job with the dbt node_id.
+
+-- 1. Cost per model per run (one run ~ one hour bucket of the scheduled build)
+WITH dbt_jobs AS (
+    SELECT
+        TIMESTAMP_TRUNC(j.creation_time, HOUR) AS run_hour,
+        (SELECT l.value FROM UNNEST(j.labels) l WHERE l.key = 'node_id') AS node_id,
+        j.total_bytes_processed,
+        j.total_bytes_billed,
+        j.total_slot_ms,
+        TIMESTAMP_DIFF(j.end_time, j.start_time, MILLISECOND) AS elapsed_ms
+    FROM `{{ target.project }}`.`region-{{ target.location | lower }}`.INFORMATION_SCHEMA.JOBS_BY_PROJECT j
+    WHERE j.creation_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 14 DAY)
+      AND j.job_type = 'QUERY'
+      AND j.destination_table.dataset_id = '{{ target.schema }}'
+      AND EXISTS (SELECT 1 FROM UNNEST(j.labels) l WHERE l.key = 'app' AND l.value = 'dbt')
+)
+
+SELECT
+    run_hour,
+    node_id,
+    COUNT(*) AS job_count,
+    ROUND(SUM(total_bytes_processed) / POW(1024, 2), 2) AS mb_processed,
+    ROUND(SUM(total_bytes_billed) / POW(1024, 2), 2) AS mb_billed,
+    SUM(total_slot_ms) AS slot_ms,
+    SUM(elapsed_ms) AS elapsed_ms
+FROM dbt_jobs
+WHERE node_id LIKE 'model_%'
+GROUP BY run_hour, node_id
+ORDER BY run_hour DESC, mb_processed DESC;
+
+-- 2. Whole-build totals per run, to compare full refresh vs incremental
+SELECT
+    TIMESTAMP_TRUNC(creation_time, HOUR) AS run_hour,
+    COUNT(*) AS job_count,
+    ROUND(SUM(total_bytes_processed) / POW(1024, 2), 2) AS mb_processed,
+    SUM(total_slot_ms) AS slot_ms,
+    TIMESTAMP_DIFF(MAX(end_time), MIN(start_time), SECOND) AS build_seconds
+FROM `{{ target.project }}`.`region-{{ target.location | lower }}`.INFORMATION_SCHEMA.JOBS_BY_PROJECT
+WHERE creation_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 14 DAY)
+  AND job_type = 'QUERY'
+  AND destination_table.dataset_id = '{{ target.schema }}'
+  AND EXISTS (SELECT 1 FROM UNNEST(labels) l WHERE l.key = 'app' AND l.value = 'dbt')
+GROUP BY run_hour
+ORDER BY run_hour DESC;
@@ -0,0 +1,93 @@
+"""Compare two benchmark result files produced by `python -m benchmarks.run`.
+
+Usage:
+    python -m benchmarks.compare benchmarks/results/<old>.json benchmarks/results/<new>.json --threshold 0.2
+"""
+import argparse
+import json
+import sys
+from typing import Dict, Optional, Tuple
+
+
+# Metrics where a larger value is an improvement; everything else is lower-is-better.
+HIGHER_IS_BETTER = {"breeds_per_s"}
+# Identifying fields, not measurements
+KEY_FIELDS = ("benchmark", "backend", "size")
+
+
+def _flatten(result: dict, prefix: str = "") -> Dict[str, Optional[float]]:
+    metrics = {}
+    for name, value in result.items():
+        if name in KEY_FIELDS:
+            continue
+        if isinstance(value, dict):
+            metrics.update(_flatten(value, f"{prefix}{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[f"{prefix}{name}"] = float(value)
+        elif value is None:
+            # e.g. time_to_first_token_s when no token arrived; compare() flags it
+            metrics[f"{prefix}{name}"] = None
+    return metrics
+
+
+def load_metrics(path: str) -> Dict[Tuple[str, str], Optional[float]]:
+    with open(path) as f:
+        report = json.load(f)
+    metrics = {}
+    for result in report["results"]:
+        scenario = "/".join(str(result[k]) for k in KEY_FIELDS if k in result)
+        for name, value in _flatten(result).items():
+            metrics[(scenario, name)] = value
+    return metrics
+
+
+def compare(old_path: str, new_path: str, threshold: float) -> int:
+    """Print per-metric changes and return the number of regressions beyond `threshold`.
+
+    A metric missing or null on either side counts as a regression, and so does any
+    increase (decrease, for HIGHER_IS_BETTER) from a zero baseline.
+    """
+    old, new = load_metrics(old_path), load_metrics(new_path)
+    regressions = 0
+    print(f"{'scenario':<28} {'metric':<32} {'old':>12} {'new':>12} {'change':>9}")
+    for key in sorted(old.keys() | new.keys()):
+        before, after = old.get(key), new.get(key)
+        if before is None or after is None:
+            regressions += 1
+            print(f"{key[0]:<28} {key[1]:<32} {_fmt(before):>12} {_fmt(after):>12} {'n/a':>9}  REGRESSION")
+            continue
+        sign = -1.0 if key[1].rsplit(".", 1)[-1] in HIGHER_IS_BETTER else 1.0
+        if before:
+            change = (after - before) / before
+            worse = sign * change
+        else:
+            change = float("inf") if after > 0 else float("-inf") if after < 0 else 0.0
+            worse = float("inf") if sign * after > 0 else 0.0
+        flag = ""
+        if worse > threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{key[0]:<28} {key[1]:<32} {before:>12.4g} {after:>12.4g} {change:>+8.1%}{flag}")
+    print(f"{regressions} regression(s) above {threshold:.0%}")
+    return regressions
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "missing" if value is None else f"{value:.4g}"
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative change counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on regressions")
+    args = parser.parse_args(argv)
+
+    regressions = compare(args.old, args.new, args.threshold)
+    if args.fail_on_regression and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Local stand-ins for BigQuery and the OpenAI API used by the benchmark suite."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import sqlglot
+from sqlglot import exp
+
+
+class FakeQueryJob:
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return self._df
+
+
+class FakeBigQueryClient:
+    """Answers `client.query(sql).to_dataframe()` from DuckDB.
+
+    BigQuery SQL is transpiled with sqlglot and fully qualified table names
+    (`project.dataset.table`) are resolved against the registered Arrow tables
+    by table name. Every query is recorded in `queries`.
+    """
+
+    def __init__(self, tables: Dict[str, pa.Table]):
+        self._con = duckdb.connect()
+        for name, table in tables.items():
+            self._con.register(name, table)
+        self._lock = threading.Lock()
+        self.queries: List[str] = []
+
+    def query(self, query: str) -> FakeQueryJob:
+        tree = sqlglot.parse_one(query, read="bigquery")
+        for table in tree.find_all(exp.Table):
+            table.set("db", None)
+            table.set("catalog", None)
+        with self._lock:
+            self.queries.append(query)
+            df = self._con.execute(tree.sql(dialect="duckdb")).df()
+        return FakeQueryJob(df)
+
+
+class FakeOpenAIServer:
+    """Minimal OpenAI-compatible /v1/chat/completions endpoint on localhost.
+
+    Streams `tokens` chunks, sleeping `first_token_latency` before the first and
+    `token_latency` between the following ones. Point the SDK at it with
+    OPENAI_BASE_URL=<server.base_url>.
+    """
+
+    def __init__(self, tokens: int = 50, token_latency: float = 0.01, first_token_latency: float = 0.2):
+        self.tokens = tokens
+        self.token_latency = token_latency
+        self.first_token_latency = first_token_latency
+        self.requests = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                fake.requests += 1
+                model = body.get("model", "fake")
+                if body.get("stream"):
+                    self._stream(model)
+                else:
+                    time.sleep(fake.first_token_latency + fake.token_latency * (fake.tokens - 1))
+                    self._send_json({
+                        "id": "chatcmpl-fake",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{
+                            "index": 0,
+                            "message": {"role": "assistant", "content": "tok " * fake.tokens},
+                            "finish_reason": "stop",
+                        }],
+                    })
+
+            def _send_json(self, payload: dict) -> None:
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream(self, model: str) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                for i in range(fake.tokens):
+                    time.sleep(fake.first_token_latency if i == 0 else fake.token_latency)
+                    chunk = {
+                        "id": "chatcmpl-fake",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": "tok "}, "finish_reason": None}],
+                    }
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                    self.wfile.flush()
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+
+        return Handler
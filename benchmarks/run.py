@@ -0,0 +1,285 @@
+"""End-to-end performance benchmarks for the Streamlit app and the dlt pipeline.
+
+The app is driven headlessly with Streamlit's AppTest. BigQuery is replaced by a
+DuckDB-backed fake client and OpenAI by a local streaming server, so the suite
+runs offline. Results are written as JSON for `python -m benchmarks.compare`.
+
+Usage:
+    python -m benchmarks.run --sizes 10000 100000 1000000
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List
+from unittest import mock
+
+import psutil
+from streamlit.testing.v1 import AppTest
+
+from benchmarks import synthetic
+from benchmarks.fakes import FakeBigQueryClient, FakeOpenAIServer
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "streamlit_app.py")
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+CHAT_PROMPT = "We have young kids and enjoy weekend hikes. Which breeds fit?"
+
+
+def _rss_mb() -> float:
+    return psutil.Process().memory_info().rss / 2**20
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    return {
+        "median_s": statistics.median(ordered),
+        "p95_s": ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))],
+        "min_s": ordered[0],
+    }
+
+
+@contextmanager
+def _measure_memory(interval: float = 0.01):
+    # RSS rather than tracemalloc: tracing would slow down the timed code and miss Arrow/DuckDB buffers.
+    # The peak is sampled by a polling thread so it covers this scenario only, not the process lifetime.
+    stats: Dict[str, float] = {}
+    rss_before = _rss_mb()
+    peak = [rss_before]
+    done = threading.Event()
+
+    def sample() -> None:
+        while not done.wait(interval):
+            peak[0] = max(peak[0], _rss_mb())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        yield stats
+    finally:
+        done.set()
+        sampler.join()
+        stats["rss_mb"] = _rss_mb()
+        stats["rss_delta_mb"] = stats["rss_mb"] - rss_before
+        stats["peak_rss_mb"] = max(peak[0], stats["rss_mb"])
+
+
+def _clear_streamlit_caches() -> None:
+    import streamlit as st
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+@contextmanager
+def _patched_backends(tables, snapshot_dir: str, openai_url: str):
+    """Route the app's BigQuery client to DuckDB, its snapshot to `snapshot_dir` and OpenAI to the fake server."""
+    from frontend import finder
+    from frontend.snapshot import SnapshotStore
+
+    fake_client = FakeBigQueryClient(tables)
+    counters = {"snapshot_queries": 0, "first_token_at": None}
+    snapshot_query = SnapshotStore.query
+    stream_openai = finder._stream_openai
+
+    def counting_snapshot_query(self, query):
+        counters["snapshot_queries"] += 1
+        return snapshot_query(self, query)
+
+    def timed_stream_openai(messages):
+        for chunk in stream_openai(messages):
+            if counters["first_token_at"] is None:
+                counters["first_token_at"] = time.perf_counter()
+            yield chunk
+
+    env = {
+        "SERVING_SNAPSHOT_DIR": snapshot_dir,
+        "OPENAI_BASE_URL": openai_url,
+    }
+    with mock.patch.dict(os.environ, env), \
+            mock.patch("google.cloud.bigquery.Client", return_value=fake_client), \
+            mock.patch("google.oauth2.service_account.Credentials.from_service_account_info"), \
+            mock.patch.object(SnapshotStore, "query", counting_snapshot_query), \
+            mock.patch.object(finder, "_stream_openai", timed_stream_openai):
+        # Never sync from the real bucket while benchmarking
+        os.environ.pop("SERVING_SNAPSHOT_URL", None)
+        yield fake_client, counters
+
+
+def _run(at: AppTest) -> float:
+    """Run the script once and return its wall time; fail if the app raised."""
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"App raised during benchmark: {at.exception[0].message}")
+    return elapsed
+
+
+def _new_app(timeout: float) -> AppTest:
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.secrets["gcp_service_account"] = {"type": "service_account"}
+    at.secrets["OPENAI_API_KEY"] = "sk-benchmark"
+    return at
+
+
+def bench_app(size: int, backend: str, reruns: int, openai: FakeOpenAIServer, timeout: float) -> Dict[str, Any]:
+    """Cold run, warm reruns, a filter change and one streamed chat turn against one backend."""
+    tables = synthetic.mart_tables(size)
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        if backend == "snapshot":
+            from src.serving_snapshot import write_snapshot
+
+            write_snapshot(tables, snapshot_dir)
+
+        with _patched_backends(tables, snapshot_dir, openai.base_url) as (client, counters), _measure_memory() as memory:
+            _clear_streamlit_caches()
+
+            def queries() -> int:
+                return len(client.queries) + counters["snapshot_queries"]
+
+            at = _new_app(timeout)
+            cold_s = _run(at)
+            cold_queries = queries()
+
+            warm, warm_queries = [], []
+            for _ in range(reruns):
+                before = queries()
+                warm.append(_run(at))
+                warm_queries.append(queries() - before)
+
+            before = queries()
+            at.sidebar.multiselect[0].select(at.sidebar.multiselect[0].options[0])
+            filter_change_s = _run(at)
+            filter_change_queries = queries() - before
+
+            counters["first_token_at"] = None
+            requests_before = openai.requests
+            at.chat_input[0].set_value(CHAT_PROMPT)
+            start = time.perf_counter()
+            chat_s = _run(at)
+            ttft_s = counters["first_token_at"] - start if counters["first_token_at"] else None
+
+    return {
+        "benchmark": "app",
+        "backend": backend,
+        "size": size,
+        "cold_run_s": cold_s,
+        "cold_queries": cold_queries,
+        "warm_rerun": _summary(warm),
+        "warm_queries_per_rerun": statistics.mean(warm_queries) if warm_queries else 0,
+        "filter_change_s": filter_change_s,
+        "filter_change_queries": filter_change_queries,
+        "chat_turn_s": chat_s,
+        "time_to_first_token_s": ttft_s,
+        "openai_requests": openai.requests - requests_before,
+        "memory": memory,
+    }
+
+
+def bench_pipeline(size: int) -> Dict[str, Any]:
+    """Run load_to_bigquery on a synthetic API payload with local dlt destinations."""
+    import dlt
+    from src import dog_api_pipeline
+
+    breeds = synthetic.raw_breeds(size)
+    real_pipeline = dlt.pipeline
+
+    with tempfile.TemporaryDirectory() as workdir:
+        def local_pipeline(*args, destination=None, **kwargs):
+            if destination == "bigquery":
+                destination = dlt.destinations.duckdb(os.path.join(workdir, "warehouse.duckdb"))
+            kwargs["pipelines_dir"] = os.path.join(workdir, "pipelines")
+            return real_pipeline(*args, destination=destination, **kwargs)
+
+        response = mock.Mock()
+        response.json.return_value = breeds
+        env = {
+            "BUCKET_URL": f"file://{os.path.join(workdir, 'raw')}",
+            "RUNTIME__DLTHUB_TELEMETRY": "false",
+        }
+        with mock.patch.dict(os.environ, env), \
+                mock.patch.object(dog_api_pipeline.requests, "get", return_value=response), \
+                mock.patch.object(dog_api_pipeline.dlt, "pipeline", local_pipeline), \
+                _measure_memory() as memory:
+            start = time.perf_counter()
+            dog_api_pipeline.load_to_bigquery()
+            elapsed = time.perf_counter() - start
+
+    return {
+        "benchmark": "pipeline",
+        "size": size,
+        "load_s": elapsed,
+        "breeds_per_s": size / elapsed,
+        "memory": memory,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def main(argv=None) -> str:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="Synthetic catalogue sizes (number of breeds)")
+    parser.add_argument("--backends", nargs="+", default=["bigquery", "snapshot"], choices=["bigquery", "snapshot"])
+    parser.add_argument("--reruns", type=int, default=10, help="Warm reruns per app benchmark")
+    parser.add_argument("--tokens", type=int, default=50, help="Tokens streamed by the fake OpenAI server")
+    parser.add_argument("--token-latency", type=float, default=0.01, help="Seconds between streamed tokens")
+    parser.add_argument("--first-token-latency", type=float, default=0.2, help="Seconds before the first token")
+    parser.add_argument("--timeout", type=float, default=300.0, help="AppTest timeout per run (seconds)")
+    parser.add_argument("--skip-app", action="store_true")
+    parser.add_argument("--skip-pipeline", action="store_true")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/<commit>.json)")
+    args = parser.parse_args(argv)
+
+    # Import the OpenAI SDK up front so its import time doesn't land in the first time-to-first-token
+    import openai  # noqa: F401
+
+    commit = _git_commit()
+    results = []
+    with FakeOpenAIServer(args.tokens, args.token_latency, args.first_token_latency) as openai:
+        if not args.skip_app:
+            # Throwaway run so one-off imports (altair, pyarrow, ...) don't inflate the first cold run
+            bench_app(100, args.backends[0], 0, openai, args.timeout)
+        for size in args.sizes:
+            if not args.skip_app:
+                for backend in args.backends:
+                    print(f"app/{backend} size={size}")
+                    results.append(bench_app(size, backend, args.reruns, openai, args.timeout))
+            if not args.skip_pipeline:
+                print(f"pipeline size={size}")
+                results.append(bench_pipeline(size))
+
+    report = {
+        "commit": commit,
+        "created_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "config": vars(args),
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Benchmark results written to {output}")
+    return output
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Synthetic breed catalogues for the benchmark suite.
+
+`raw_breeds` mimics TheDogAPI /v1/breeds payload (input of the dlt pipeline);
+`mart_tables` mimics the dbt marts the Streamlit app reads.
+"""
+from typing import Any, Dict, List
+
+import numpy as np
+import pyarrow as pa
+
+
+BREED_GROUPS = ["Sporting", "Hound", "Working", "Terrier", "Toy", "Non-Sporting", "Herding", "Mixed", ""]
+SIZE_CATEGORIES = ["Very Small", "Small", "Medium", "Large", "Extra Large"]
+FAMILY_SUITABILITY = [
+    "Excellent for Families",
+    "Good for Families",
+    "Moderate for Families",
+    "Good Guard Dog",
+    "Needs Experienced Owner",
+]
+TRAITS = [
+    "Affectionate", "Friendly", "Loyal", "Gentle", "Playful", "Intelligent", "Alert", "Calm",
+    "Energetic", "Protective", "Independent", "Stubborn", "Trainable", "Courageous", "Patient",
+    "Sociable", "Quiet", "Dignified", "Active", "Obedient",
+]
+ORIGINS = ["Germany", "United Kingdom", "France", "Japan", "United States", "Russia", ""]
+
+
+def raw_breeds(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Return `n` breed records shaped like the TheDogAPI response."""
+    rng = np.random.default_rng(seed)
+    weight_min = rng.integers(3, 90, n)
+    weight_span = rng.integers(1, 40, n)
+    height_min = rng.integers(6, 30, n)
+    height_span = rng.integers(1, 6, n)
+    life_min = rng.integers(6, 14, n)
+    life_span = rng.integers(1, 5, n)
+    groups = rng.integers(0, len(BREED_GROUPS), n)
+    origins = rng.integers(0, len(ORIGINS), n)
+    trait_counts = rng.integers(0, 8, n)
+
+    breeds = []
+    for i in range(n):
+        w_lo, w_hi = int(weight_min[i]), int(weight_min[i] + weight_span[i])
+        h_lo, h_hi = int(height_min[i]), int(height_min[i] + height_span[i])
+        traits = rng.choice(TRAITS, size=int(trait_counts[i]), replace=False) if trait_counts[i] else []
+        breeds.append({
+            "id": i + 1,
+            "name": f"Synthetic Breed {i + 1}",
+            "bred_for": "Companionship",
+            "breed_group": BREED_GROUPS[groups[i]],
+            "life_span": f"{life_min[i]} - {life_min[i] + life_span[i]} years",
+            "temperament": ", ".join(traits),
+            "origin": ORIGINS[origins[i]],
+            "weight": {"imperial": f"{w_lo} - {w_hi}", "metric": f"{round(w_lo * 0.4536)} - {round(w_hi * 0.4536)}"},
+            "height": {"imperial": f"{h_lo} - {h_hi}", "metric": f"{round(h_lo * 2.54)} - {round(h_hi * 2.54)}"},
+            "reference_image_id": f"img{i + 1:07d}",
+        })
+    return breeds
+
+
+def mart_tables(n: int, seed: int = 0) -> Dict[str, pa.Table]:
+    """Return dim_breeds, dim_temperament and trait_index for `n` breeds."""
+    rng = np.random.default_rng(seed)
+    breed_id = np.arange(1, n + 1, dtype=np.int64)
+    breed_name = np.char.add("Synthetic Breed ", breed_id.astype(str))
+    avg_weight_kg = np.round(rng.uniform(1.5, 80.0, n), 1)
+    size_idx = np.digitize(avg_weight_kg, [4.5, 11.5, 27.0, 41.0])
+    trait_counts = rng.integers(0, 8, n)
+
+    dim_breeds = pa.table({
+        "breed_id": breed_id,
+        "breed_name": breed_name,
+        "breed_group": np.array(BREED_GROUPS, dtype=object)[rng.integers(0, len(BREED_GROUPS), n)],
+        "size_category": np.array(SIZE_CATEGORIES, dtype=object)[size_idx],
+        "avg_weight_kg": avg_weight_kg,
+        "avg_life_span_years": np.round(rng.uniform(6.0, 18.0, n), 1),
+        "temperament_trait_count": trait_counts,
+    })
+
+    # Flattened (breed, trait) pairs, then re-grouped into per-breed arrays
+    trait_breed = np.repeat(breed_id, trait_counts)
+    trait_names = np.array(TRAITS, dtype=object)[rng.integers(0, len(TRAITS), int(trait_counts.sum()))]
+    offsets = np.concatenate([[0], np.cumsum(trait_counts)])
+    family = np.array(FAMILY_SUITABILITY, dtype=object)[rng.integers(0, len(FAMILY_SUITABILITY), n)]
+
+    dim_temperament = pa.table({
+        "breed_id": breed_id,
+        "breed_name": breed_name,
+        "total_traits": trait_counts,
+        "trait_array": pa.ListArray.from_arrays(pa.array(offsets, pa.int32()), pa.array(trait_names, pa.string())),
+        "family_suitability": family,
+    })
+    trait_index = pa.table({
+        "breed_id": trait_breed,
+        "temperament_trait": trait_names,
+        "family_suitability": np.repeat(family, trait_counts),
+    })
+    return {"dim_breeds": dim_breeds, "dim_temperament": dim_temperament, "trait_index": trait_index}
@@ -2,11 +2,14 @@ import streamlit as st
 import pandas as pd
 
 
-def sql_str(val: str) -> str:
-    return "'" + str(val).replace("'", "\\'") + "'"
+def sql_str(val: str, dialect: str = "bigquery") -> str:
+    # DuckDB only understands doubled quotes; BigQuery reads '' as two adjacent literals
+    if dialect == "duckdb":
+        return "'" + str(val).replace("'", "''") + "'"
+    return "'" + str(val).replace("\\", "\\\\").replace("'", "\\'") + "'"
 
 
-def render_filters(run_query_df, tables) -> dict:
+def render_filters(run_query_df, tables, dialect: str = "bigquery") -> dict:
     """Render sidebar filters and return a dict with filter clauses and selections.
 
     Returns keys:
@@ -88,17 +91,17 @@ def render_filters(run_query_df, tables) -> dict:
     # Build clauses
     clauses = []
     if breed_groups:
-        vals = ",".join([sql_str(v) for v in breed_groups])
+        vals = ",".join([sql_str(v, dialect) for v in breed_groups])
         clauses.append(f"b.breed_group in ({vals})")
     if size_categories:
-        vals = ",".join([sql_str(v) for v in size_categories])
+        vals = ",".join([sql_str(v, dialect) for v in size_categories])
         clauses.append(f"b.size_category in ({vals})")
     clauses.append(f"b.avg_weight_kg between {weight_range[0]} and {weight_range[1]}")
     filters_clause = (" and ".join(clauses)) if clauses else "1=1"
 
     temp_clause = ""
     if family_suitability:
-        vals = ",".join([sql_str(v) for v in family_suitability])
+        vals = ",".join([sql_str(v, dialect) for v in family_suitability])
         temp_clause = f"and tt.family_suitability in ({vals})"
 
     return {
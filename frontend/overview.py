@@ -8,7 +8,7 @@ def render_overview(run_query_df, tables, filters_clause: str, temp_clause: str)
     st.caption("Insights powered by BigQuery")
 
     table_dim_breeds = tables["dim_breeds"]
-    table_dim_temperament = tables["dim_temperament"]
+    table_trait_index = tables["trait_index"]
 
     col1, col2 = st.columns(2)
 
@@ -74,13 +74,12 @@ def render_overview(run_query_df, tables, filters_clause: str, temp_clause: str)
             from {table_dim_breeds} b
             where {filters_clause}
         ), traits as (
-            select tt.breed_id, trait
-            from {table_dim_temperament} tt
-            join base using (breed_id),
-            unnest(tt.trait_array) as trait
-            where tt.total_traits > 0 {temp_clause.replace('t.', 'tt.')}
+            select tt.breed_id, tt.temperament_trait as trait
+            from {table_trait_index} tt
+            join base using (breed_id)
+            where 1=1 {temp_clause}
         )
-        select lower(trim(trait)) as temperament_trait, count(*) as occurrences
+        select lower(trait) as temperament_trait, count(*) as occurrences
         from traits
         group by temperament_trait
         order by occurrences desc
@@ -0,0 +1,165 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import pandas as pd
+
+
+MANIFEST_NAME = "manifest.json"
+
+
+class SnapshotStore:
+    """Serve app queries from the memory-mapped serving snapshot.
+
+    The snapshot is a directory of Arrow IPC files plus a manifest.json, published
+    by src/serving_snapshot.py after the dbt build. Files are memory-mapped
+    (zero-copy) and queried with DuckDB. When a newer manifest appears the
+    tables are re-mapped and swapped in; readers keep the previous version until then.
+    If `remote_url` is set, a background thread copies new versions into `local_dir`
+    every `remote_check_seconds`; `storage_options` are passed to fsspec (e.g. a
+    service account `token` for gcsfs). On a cold start without a local copy, the
+    first refresh waits up to `cold_start_timeout` seconds for that first sync.
+    """
+
+    def __init__(
+        self,
+        local_dir: str,
+        remote_url: Optional[str] = None,
+        remote_check_seconds: float = 60.0,
+        storage_options: Optional[dict] = None,
+        cold_start_timeout: float = 10.0,
+    ):
+        self.local_dir = local_dir
+        self.remote_url = remote_url
+        self.remote_check_seconds = remote_check_seconds
+        self.storage_options = storage_options or {}
+        self.cold_start_timeout = cold_start_timeout
+        self.version: Optional[str] = None
+        self._con = None
+        self._tables: Dict[str, object] = {}
+        self._manifest_mtime: Optional[float] = None
+        self._sync_thread: Optional[threading.Thread] = None
+        self._first_sync = threading.Event()
+        self._cold_start_waited = False
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._tables)
+
+    def tables(self) -> Dict[str, str]:
+        return {"dim_breeds": "dim_breeds", "dim_temperament": "dim_temperament", "trait_index": "trait_index"}
+
+    def refresh(self) -> bool:
+        """Load the newest local snapshot if one appeared since the last call. Returns `ready`.
+
+        Only the local manifest is checked here; remote versions arrive via the sync thread.
+        """
+        self._start_sync()
+
+        manifest_path = os.path.join(self.local_dir, MANIFEST_NAME)
+        if self.remote_url and not self._cold_start_waited and not os.path.exists(manifest_path):
+            # Cold start (e.g. a fresh Streamlit Cloud container): let the first sync
+            # land so the first paint doesn't depend on BigQuery. Only waited for once.
+            self._cold_start_waited = True
+            if not self._first_sync.wait(self.cold_start_timeout):
+                print("Serving snapshot not synced yet, falling back to BigQuery")
+        try:
+            mtime = os.path.getmtime(manifest_path)
+        except OSError:
+            return self.ready
+        if mtime == self._manifest_mtime:
+            return self.ready
+
+        with self._lock:
+            if mtime == self._manifest_mtime:
+                return self.ready
+            try:
+                with open(manifest_path) as f:
+                    manifest = json.load(f)
+                if manifest["version"] != self.version:
+                    tables = self._map_tables(manifest)
+                    if self._con is None:
+                        import duckdb
+
+                        self._con = duckdb.connect()
+                    self._tables = tables
+                    self.version = manifest["version"]
+                    print(f"Serving snapshot {self.version} loaded")
+                    self._prune_local()
+            except Exception as e:
+                print(f"Serving snapshot could not be loaded: {e}")
+            self._manifest_mtime = mtime
+        return self.ready
+
+    def query(self, query: str) -> pd.DataFrame:
+        # Each query gets its own cursor so concurrent Streamlit sessions don't share
+        # state; registering an Arrow table on it is a zero-copy reference.
+        tables = self._tables
+        cursor = self._con.cursor()
+        for name, table in tables.items():
+            cursor.register(name, table)
+        return cursor.execute(query).df()
+
+    def _map_tables(self, manifest: dict) -> Dict[str, object]:
+        import pyarrow as pa
+
+        tables = {}
+        for name, entry in manifest["tables"].items():
+            source = pa.memory_map(os.path.join(self.local_dir, entry["file"]), "r")
+            tables[name] = pa.ipc.open_file(source).read_all()
+        return tables
+
+    def _prune_local(self) -> None:
+        # Old versions stay readable for sessions still holding them: the mapped files are only unlinked
+        from src.serving_snapshot import prune_old_versions
+        import fsspec
+
+        try:
+            prune_old_versions(fsspec.filesystem("file"), self.local_dir)
+        except Exception as e:
+            print(f"Serving snapshot prune failed: {e}")
+
+    def _start_sync(self) -> None:
+        if not self.remote_url or self._sync_thread is not None:
+            return
+        with self._lock:
+            if self._sync_thread is None:
+                self._sync_thread = threading.Thread(target=self._sync_loop, name="snapshot-sync", daemon=True)
+                self._sync_thread.start()
+
+    def _sync_loop(self) -> None:
+        while True:
+            try:
+                self._sync_remote()
+            except Exception as e:
+                print(f"Serving snapshot sync failed, keeping local copy: {e}")
+            self._first_sync.set()
+            time.sleep(self.remote_check_seconds)
+
+    def _sync_remote(self) -> None:
+        import fsspec
+
+        fs, root = fsspec.core.url_to_fs(self.remote_url, **self.storage_options)
+        with fs.open(f"{root}/{MANIFEST_NAME}", "r") as f:
+            manifest = json.load(f)
+        local_manifest_path = os.path.join(self.local_dir, MANIFEST_NAME)
+        if os.path.exists(local_manifest_path):
+            with open(local_manifest_path) as f:
+                if json.load(f)["version"] == manifest["version"]:
+                    return
+
+        for entry in manifest["tables"].values():
+            local_path = os.path.join(self.local_dir, entry["file"])
+            if not os.path.exists(local_path):
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                fs.get(f"{root}/{entry['file']}", local_path + ".tmp")
+                os.replace(local_path + ".tmp", local_path)
+
+        # Manifest goes last so refresh() only ever sees complete versions
+        tmp_manifest = os.path.join(self.local_dir, MANIFEST_NAME + ".tmp")
+        with open(tmp_manifest, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_manifest, local_manifest_path)
@@ -0,0 +1,12 @@
+{% macro delete_removed_breeds(upstream_relation, upstream_key='breed_id') -%}
+  {#
+    Post-hook for the incremental merge models: merge never deletes, so drop
+    breeds that no longer exist upstream (bronze.dog_breeds holds the latest
+    extract only). Only the key columns are scanned.
+  #}
+  delete from {{ this }}
+  where breed_id not in (
+      select {{ upstream_key }} from {{ upstream_relation }}
+      where {{ upstream_key }} is not null
+  )
+{%- endmacro %}
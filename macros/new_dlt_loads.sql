@@ -0,0 +1,17 @@
+{% macro new_dlt_loads(load_id_column='_dlt_load_id') -%}
+  {#
+    Restrict an incremental mart to staging rows it has not seen yet.
+    - First build / --full-refresh: no filter, the whole staging table is processed.
+    - Incremental runs: only rows whose _dlt_load_id is newer than the latest
+      one already materialized in {{ this }}.
+    stg_dog_breeds only merges breeds whose content hash changed, so unchanged
+    breeds keep the load id of their last change and are skipped here.
+    dlt load ids are fixed-width epoch strings, so string comparison orders them.
+    Tables built before the column existed are processed in full once.
+  #}
+  {% if is_incremental() and relation_has_column(this, load_id_column) %}
+    where {{ load_id_column }} > (
+        select coalesce(max({{ load_id_column }}), '') from {{ this }}
+    )
+  {% endif %}
+{%- endmacro %}
@@ -0,0 +1,9 @@
+{% macro relation_has_column(relation, column_name) -%}
+  {#
+    True if the existing relation already has the column. Incremental filters
+    use it to fall back to a full pass while a table built before the column
+    was introduced is migrated (on_schema_change then appends the column).
+  #}
+  {% set columns = adapter.get_columns_in_relation(relation) | map(attribute='name') | map('lower') | list %}
+  {{ return(column_name | lower in columns) }}
+{%- endmacro %}
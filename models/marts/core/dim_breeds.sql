@@ -1,7 +1,14 @@
-{{ config(materialized='table') }}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='merge',
+    unique_key='breed_id',
+    on_schema_change='append_new_columns',
+    post_hook="{{ delete_removed_breeds(ref('stg_dog_breeds')) }}"
+) }}
 
 with staging_data as (
     select * from {{ ref('stg_dog_breeds') }}
+    {{ new_dlt_loads() }}
 ),
 
 breed_dimensions as (
@@ -142,6 +149,7 @@ breed_dimensions as (
         cast(has_temperament_data as int64) as data_completeness_score,
         
         -- Metadata
+        _dlt_load_id,
         extracted_at,
         extraction_date
         
@@ -1,7 +1,14 @@
-{{ config(materialized='table') }}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='merge',
+    unique_key='breed_id',
+    on_schema_change='append_new_columns',
+    post_hook="{{ delete_removed_breeds(ref('stg_dog_breeds')) }}"
+) }}
 
 with staging_data as (
     select * from {{ ref('stg_dog_breeds') }}
+    {{ new_dlt_loads() }}
 ),
 
 -- Normalize temperament traits into individual rows
@@ -23,6 +30,7 @@ breed_temperament_analysis as (
         s.breed_id,
         s.breed_name,
         s.temperament_raw,
+        s._dlt_load_id,
         
         -- Count of traits (0 if no temperament data)
         coalesce(count(t.temperament_trait), 0) as total_traits,
@@ -78,7 +86,7 @@ breed_temperament_analysis as (
         
     from staging_data s
     left join temperament_traits t on s.breed_id = t.breed_id
-    group by s.breed_id, s.breed_name, s.temperament_raw
+    group by s.breed_id, s.breed_name, s.temperament_raw, s._dlt_load_id
 ),
 
 -- Create temperament profile scores
@@ -108,7 +116,10 @@ temperament_profiles as (
         independent_traits_count,
         calm_traits_count,
         family_friendly_traits,
-        working_traits_count
+        working_traits_count,
+        
+        -- Metadata
+        _dlt_load_id
         
     from breed_temperament_analysis
 ),
@@ -1,9 +1,19 @@
 {{ config(
-    materialized='view'
+    materialized='incremental',
+    incremental_strategy='merge',
+    unique_key='breed_id',
+    on_schema_change='append_new_columns',
+    post_hook="{{ delete_removed_breeds(source('bronze', 'dog_breeds'), 'cast(id as int64)') }}"
 ) }}
 
 with source_data as (
-    select * from {{ source('bronze', 'dog_breeds') }}
+    select
+        b.*,
+        -- Content hash of the raw record (load metadata excluded) to detect changed breeds
+        to_hex(md5(to_json_string((
+            select as struct b.* except (_dlt_load_id, _dlt_id, extracted_at, extraction_date)
+        )))) as record_hash
+    from {{ source('bronze', 'dog_breeds') }} b
 ),
 
 parsed_data as (
@@ -15,6 +25,7 @@ parsed_data as (
         -- DLT metadata
         _dlt_load_id,
         _dlt_id,
+        record_hash,
         cast(extracted_at as timestamp) as extracted_at,
         cast(extraction_date as date) as extraction_date,
         
@@ -192,4 +203,8 @@ parsed_data as (
 
 select * from parsed_data
 where breed_id is not null
-  and breed_name is not null
\ No newline at end of file
+  and breed_name is not null
+{% if is_incremental() and relation_has_column(this, 'record_hash') %}
+  -- bronze.dog_breeds is replaced on every load, so only merge breeds whose content changed
+  and record_hash not in (select record_hash from {{ this }} where record_hash is not null)
+{% endif %}
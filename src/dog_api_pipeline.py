@@ -2,13 +2,18 @@ import dlt
 import requests
 from datetime import datetime
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+from src.raw_history import commit_manifest, save_history
+
+
+DOG_BREEDS_COLUMNS = {"extracted_at": {"data_type": "timestamp"}}
 
 
 @dlt.resource(
     name="dog_breeds",
     write_disposition="replace",  # Replace data each run since it's a static dataset
-    columns={"extracted_at": {"data_type": "timestamp"}}
+    columns=DOG_BREEDS_COLUMNS
 )
 def fetch_dog_breeds() -> List[Dict[str, Any]]:
     """
@@ -37,29 +42,51 @@ def fetch_dog_breeds() -> List[Dict[str, Any]]:
         raise
 
 
-def save_to_cloud_storage(data: List[Dict[str, Any]], date_partition: str) -> None:
-    """
-    Save raw JSON data to Cloud Storage partitioned by date
-    Using dlt's filesystem destination with GCS staging
-    """
+def _history_url() -> str:
     import os
     os.environ.setdefault('BUCKET_URL', 'gs://dog-breed-raw-data')
     os.environ.setdefault('DESTINATION__BIGQUERY__LOCATION', 'europe-north2')
+    return f"{os.environ['BUCKET_URL'].rstrip('/')}/raw_history"
 
-    # Create filesystem pipeline for Cloud Storage
-    filesystem_pipeline = dlt.pipeline(
-        pipeline_name="dog_breeds_raw_storage",
-        destination="filesystem",
-        dataset_name=f"raw_data_{date_partition[:4]}_{date_partition[5:7]}_{date_partition[8:10]}"
-    )
 
-    @dlt.resource(name="raw_dog_api_data")
-    def raw_data():
-        return data
-    
-    # Run the filesystem pipeline to save to GCS
-    filesystem_pipeline.run(raw_data())
+def save_to_cloud_storage(
+    data: List[Dict[str, Any]], date_partition: str
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Save raw breed records to the content-addressed history store in Cloud Storage.
+    Only new or changed record versions are written (see src/raw_history.py).
+    Returns the change rows for the dog_breed_versions table and the day manifest,
+    to be committed with commit_cloud_storage_manifest() after the load succeeds.
+    """
+    if not data:
+        raise ValueError("No breeds fetched; not recording an empty catalogue")
+    changes, manifest = save_history(data, date_partition, _history_url(), data[0]["extracted_at"])
     print(f"Raw data saved to Cloud Storage for date: {date_partition}")
+    return changes, manifest
+
+
+def commit_cloud_storage_manifest(manifest: Dict[str, Any]) -> None:
+    """
+    Record the day manifest once its change rows are in BigQuery
+    """
+    commit_manifest(manifest, _history_url())
+    print(f"History manifest committed for date: {manifest['date']}")
+
+
+@dlt.resource(
+    name="dog_breed_versions",
+    write_disposition="append",  # Change log: one row per new, changed or removed breed version
+    columns={
+        "valid_from": {"data_type": "timestamp"},
+        "extracted_at": {"data_type": "timestamp"},
+        "record_hash": {"data_type": "text"},
+    }
+)
+def dog_breed_versions(changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Breed version changes detected by the history store
+    """
+    return changes
 
 
 def load_to_bigquery() -> None:
@@ -76,13 +103,26 @@ def load_to_bigquery() -> None:
     # Fetch data
     breeds_data = list(fetch_dog_breeds())
     
-    # Save raw data to Cloud Storage (partitioned)
+    # Save raw data to the Cloud Storage history store (only changed records)
     current_date = datetime.utcnow().date().isoformat()
     # print(f"Skipping raw data save to Cloud Storage for now")
-    save_to_cloud_storage(breeds_data, current_date)
+    changes, manifest = save_to_cloud_storage(breeds_data, current_date)
+    
+    # Load to BigQuery bronze tables (current catalogue + version change log).
+    # Load the records fetched above rather than calling the API again, so the
+    # catalogue and the change log describe the same extraction.
+    breeds = dlt.resource(
+        breeds_data,
+        name="dog_breeds",
+        write_disposition="replace",
+        columns=DOG_BREEDS_COLUMNS
+    )
+    load_info = pipeline.run([breeds, dog_breed_versions(changes)])
+    load_info.raise_on_failed_jobs()
     
-    # Load to BigQuery bronze table
-    load_info = pipeline.run(fetch_dog_breeds())
+    # Only now advance the history state: if the load fails, the next run diffs
+    # against the previous manifest and emits these changes again
+    commit_cloud_storage_manifest(manifest)
     
     print(f"Pipeline completed successfully!")
     print(f"Tables loaded: {load_info}")
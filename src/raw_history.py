@@ -0,0 +1,151 @@
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import fsspec
+
+
+# Fields added at extraction time; they change every run, so they are not part of a record's content
+VOLATILE_FIELDS = ("extracted_at", "extraction_date")
+BLOBS_DIR = "blobs"
+MANIFESTS_DIR = "manifests"
+
+
+def record_hash(record: Dict[str, Any]) -> str:
+    """
+    Content hash of a breed record (canonical JSON, extraction metadata excluded)
+    """
+    return hashlib.sha256(_canonical_json(record).encode("utf-8")).hexdigest()
+
+
+def _canonical_json(record: Dict[str, Any]) -> str:
+    content = {k: v for k, v in record.items() if k not in VOLATILE_FIELDS}
+    return json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _blob_path(root: str, digest: str) -> str:
+    return f"{root}/{BLOBS_DIR}/{digest[:2]}/{digest}.json"
+
+
+def _manifest_dates(fs, root: str) -> List[str]:
+    try:
+        paths = fs.ls(f"{root}/{MANIFESTS_DIR}", detail=False)
+    except FileNotFoundError:
+        return []
+    return sorted(p.rstrip("/").rsplit("/", 1)[-1][:-len(".json")] for p in paths if p.endswith(".json"))
+
+
+def _write(fs, path: str, content: bytes) -> None:
+    fs.makedirs(path.rsplit("/", 1)[0], exist_ok=True)
+    fs.pipe_file(path, content)
+
+
+def _read_manifest(fs, root: str, date: str) -> Dict[str, Any]:
+    with fs.open(f"{root}/{MANIFESTS_DIR}/{date}.json", "r") as f:
+        return json.load(f)
+
+
+def latest_manifest(history_url: str, on_or_before: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Most recent day manifest, optionally as of a given date (YYYY-MM-DD)
+    """
+    fs, root = fsspec.core.url_to_fs(history_url)
+    dates = [d for d in _manifest_dates(fs, root) if on_or_before is None or d <= on_or_before]
+    return _read_manifest(fs, root, dates[-1]) if dates else None
+
+
+def save_history(
+    data: List[Dict[str, Any]],
+    date_partition: str,
+    history_url: str,
+    extracted_at: str,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Save a day's breed catalogue to the content-addressed history store.
+
+    Only record versions not seen before are written, as blobs/<hash[:2]>/<hash>.json.
+    Returns the change rows (new, changed and removed breeds) relative to the previous
+    state, and the day's manifest of breed_id -> hash. The manifest is not written here:
+    call commit_manifest() once the change rows are loaded, so a failed load is
+    re-detected on the next run instead of being lost.
+    """
+    # An empty fetch would mark every breed as removed
+    if not data:
+        raise ValueError(f"Refusing to save an empty breed catalogue for {date_partition}")
+    if not extracted_at:
+        raise ValueError("extracted_at is required to date the breed versions")
+
+    fs, root = fsspec.core.url_to_fs(history_url)
+    previous = latest_manifest(history_url, on_or_before=date_partition)
+    previous_records = previous["records"] if previous else {}
+
+    records: Dict[str, str] = {}
+    changes: List[Dict[str, Any]] = []
+    blobs_written = 0
+    for breed in data:
+        breed_id = str(breed["id"])
+        digest = record_hash(breed)
+        records[breed_id] = digest
+        if previous_records.get(breed_id) == digest:
+            continue
+
+        path = _blob_path(root, digest)
+        # A changed record may revert to a version stored on an earlier day
+        if not fs.exists(path):
+            _write(fs, path, _canonical_json(breed).encode("utf-8"))
+            blobs_written += 1
+        changes.append({
+            **breed,
+            "record_hash": digest,
+            "change_type": "changed" if breed_id in previous_records else "new",
+            "valid_from": extracted_at,
+        })
+
+    for breed_id in previous_records.keys() - records.keys():
+        changes.append({
+            "id": int(breed_id),
+            "record_hash": None,
+            "change_type": "removed",
+            "valid_from": extracted_at,
+        })
+
+    manifest = {
+        "date": date_partition,
+        "extracted_at": extracted_at,
+        "records": records,
+    }
+    print(
+        f"History for {date_partition}: {len(records)} breeds, {len(changes)} changes, "
+        f"{blobs_written} new blobs"
+    )
+    return changes, manifest
+
+
+def commit_manifest(manifest: Dict[str, Any], history_url: str) -> None:
+    """
+    Write a day manifest returned by save_history(), making it the state later runs diff against
+    """
+    fs, root = fsspec.core.url_to_fs(history_url)
+    _write(
+        fs,
+        f"{root}/{MANIFESTS_DIR}/{manifest['date']}.json",
+        json.dumps(manifest, sort_keys=True, separators=(",", ":")).encode("utf-8"),
+    )
+
+
+def load_history_state(history_url: str, date: Optional[str] = None) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """
+    Reconstruct the full breed catalogue as of a date (default: latest).
+    Reads one manifest and its blobs in a single batched fetch.
+    Returns (manifest date, records).
+    """
+    manifest = latest_manifest(history_url, on_or_before=date)
+    if manifest is None:
+        return None, []
+    if not manifest["records"]:
+        return manifest["date"], []
+    fs, root = fsspec.core.url_to_fs(history_url)
+    records = sorted(manifest["records"].items(), key=lambda item: int(item[0]))
+    paths = [_blob_path(root, digest) for _, digest in records]
+    contents = fs.cat(paths)
+    return manifest["date"], [json.loads(contents[path]) for path in paths]
@@ -0,0 +1,105 @@
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import fsspec
+import pyarrow as pa
+from google.cloud import bigquery
+
+
+DEFAULT_SNAPSHOT_URL = "gs://dog-breed-raw-data/serving_snapshot"
+DEFAULT_PROJECT_DATASET = "dog-breed-explorer-470208.dog_explorer"
+MANIFEST_NAME = "manifest.json"
+KEEP_VERSIONS = 3
+
+# Tables served by the Streamlit app. trait_index is dim_temperament flattened to
+# one row per (breed, trait) so the app does not need UNNEST at query time.
+SNAPSHOT_QUERIES = {
+    "dim_breeds": "select * from `{dataset}.dim_breeds`",
+    "dim_temperament": "select * from `{dataset}.dim_temperament`",
+    "trait_index": """
+        select t.breed_id, trim(trait) as temperament_trait, t.family_suitability
+        from `{dataset}.dim_temperament` t,
+        unnest(t.trait_array) as trait
+        where t.total_traits > 0
+    """,
+}
+
+
+def fetch_snapshot_tables(client: bigquery.Client, project_dataset: str) -> Dict[str, pa.Table]:
+    """
+    Read the serving tables from the dbt marts as Arrow tables
+    """
+    tables = {}
+    for name, query in SNAPSHOT_QUERIES.items():
+        tables[name] = client.query(query.format(dataset=project_dataset)).to_arrow()
+        print(f"Fetched {tables[name].num_rows} rows for {name}")
+    return tables
+
+
+def write_snapshot(tables: Dict[str, pa.Table], snapshot_url: str, version: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Write tables as uncompressed Arrow IPC (Feather v2) files under <snapshot_url>/<version>/
+    and publish the manifest last, so readers never see a partially written version.
+    Files are left uncompressed so the app can memory-map them without copying.
+    """
+    fs, root = fsspec.core.url_to_fs(snapshot_url)
+    version = version or datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    fs.makedirs(f"{root}/{version}", exist_ok=True)
+
+    manifest_tables = {}
+    for name, table in tables.items():
+        file_name = f"{version}/{name}.arrow"
+        with fs.open(f"{root}/{file_name}", "wb") as f:
+            with pa.ipc.new_file(f, table.schema) as writer:
+                writer.write_table(table)
+        manifest_tables[name] = {"file": file_name, "rows": table.num_rows}
+
+    manifest = {
+        "version": version,
+        "created_at": datetime.utcnow().isoformat(),
+        "tables": manifest_tables,
+    }
+    manifest_path = f"{root}/{MANIFEST_NAME}"
+    tmp_path = f"{manifest_path}.tmp"
+    with fs.open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    fs.mv(tmp_path, manifest_path)
+
+    prune_old_versions(fs, root, keep=KEEP_VERSIONS)
+    print(f"Serving snapshot {version} published to {snapshot_url}")
+    return manifest
+
+
+def prune_old_versions(fs, root: str, keep: int = KEEP_VERSIONS) -> None:
+    """
+    Remove all but the `keep` newest version directories under root
+    """
+    versions = sorted(
+        p.rstrip("/").rsplit("/", 1)[-1]
+        for p in fs.ls(root, detail=False)
+        if fs.isdir(p)
+    )
+    for version in versions[:-keep]:
+        fs.rm(f"{root}/{version}", recursive=True)
+
+
+def publish_serving_snapshot(
+    snapshot_url: Optional[str] = None,
+    project_dataset: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Publish a compact serving snapshot of the marts for the Streamlit app.
+    Run after the dbt build.
+    """
+    snapshot_url = snapshot_url or os.environ.get("SERVING_SNAPSHOT_URL", DEFAULT_SNAPSHOT_URL)
+    project_dataset = project_dataset or os.environ.get("SERVING_PROJECT_DATASET", DEFAULT_PROJECT_DATASET)
+
+    client = bigquery.Client(project=project_dataset.split(".")[0])
+    tables = fetch_snapshot_tables(client, project_dataset)
+    return write_snapshot(tables, snapshot_url)
+
+
+if __name__ == "__main__":
+    publish_serving_snapshot()
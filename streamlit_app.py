@@ -1,3 +1,4 @@
+import os
 import streamlit as st
 import pandas as pd
 from google.oauth2 import service_account
@@ -5,32 +6,78 @@ from google.cloud import bigquery
 from frontend.overview import render_overview
 from frontend.finder import render_finder
 from frontend.filters import render_filters
+from frontend.snapshot import SnapshotStore
 
 st.set_page_config(page_title="Dogs as a Service - Explorer", page_icon="🐶", layout="wide")
 
-# Create API client.
-credentials = service_account.Credentials.from_service_account_info(
-    st.secrets["gcp_service_account"]
-)
-client = bigquery.Client(credentials=credentials)
-
 # Dataset/table constants
 PROJECT_DATASET = "dog-breed-explorer-470208.dog_explorer"
 TABLE_FCT = f"`{PROJECT_DATASET}.fct_breed_metrics`"
 TABLE_DIM_BREEDS = f"`{PROJECT_DATASET}.dim_breeds`"
 TABLE_DIM_TEMPERAMENT = f"`{PROJECT_DATASET}.dim_temperament`"
+# Same shape as the trait_index table in the serving snapshot
+TABLE_TRAIT_INDEX = f"""(
+    select t.breed_id, trim(trait) as temperament_trait, t.family_suitability
+    from {TABLE_DIM_TEMPERAMENT} t, unnest(t.trait_array) as trait
+    where t.total_traits > 0
+)"""
+BIGQUERY_TABLES = {
+    "dim_breeds": TABLE_DIM_BREEDS,
+    "dim_temperament": TABLE_DIM_TEMPERAMENT,
+    "trait_index": TABLE_TRAIT_INDEX,
+}
+
+# Serving snapshot published after the dbt build (see src/serving_snapshot.py)
+SNAPSHOT_DIR = os.environ.get("SERVING_SNAPSHOT_DIR", ".serving_snapshot")
+SNAPSHOT_URL = os.environ.get("SERVING_SNAPSHOT_URL")
+
+
+# Create API client lazily so the app can start (and serve the snapshot) offline.
+@st.cache_resource
+def get_bigquery_client() -> bigquery.Client:
+    credentials = service_account.Credentials.from_service_account_info(
+        st.secrets["gcp_service_account"]
+    )
+    return bigquery.Client(credentials=credentials)
+
+
+@st.cache_resource
+def get_snapshot_store() -> SnapshotStore:
+    # Streamlit Cloud has no default GCP credentials, so sync with the app's service account
+    storage_options = {}
+    if SNAPSHOT_URL and "gcp_service_account" in st.secrets:
+        storage_options["token"] = dict(st.secrets["gcp_service_account"])
+    return SnapshotStore(SNAPSHOT_DIR, remote_url=SNAPSHOT_URL, storage_options=storage_options)
 
 
 # Cached query helper
 @st.cache_data(ttl=600)
 def run_query_df(query: str) -> pd.DataFrame:
-    query_job = client.query(query)
+    query_job = get_bigquery_client().query(query)
     return query_job.to_dataframe()
 
 
+# Snapshot results are immutable per version, so cache them until the next swap
+@st.cache_data(max_entries=256)
+def run_snapshot_query_df(query: str, version: str) -> pd.DataFrame:
+    return get_snapshot_store().query(query)
+
+
+# Serve from the snapshot when one is available (hot-swapped on new manifests),
+# otherwise fall back to live BigQuery.
+snapshot_store = get_snapshot_store()
+if snapshot_store.refresh():
+    query_fn = lambda query: run_snapshot_query_df(query, snapshot_store.version)  # noqa: E731
+    tables = snapshot_store.tables()
+    sql_dialect = "duckdb"
+else:
+    query_fn, tables, sql_dialect = run_query_df, BIGQUERY_TABLES, "bigquery"
+
+
 filters = render_filters(
-    run_query_df,
-    {"dim_breeds": TABLE_DIM_BREEDS, "dim_temperament": TABLE_DIM_TEMPERAMENT},
+    query_fn,
+    tables,
+    sql_dialect,
 )
 filters_clause = filters["filters_clause"]
 temp_clause = filters["temp_clause"]
@@ -40,16 +87,16 @@ tab_overview, tab_finder = st.tabs(["Overview", "Find Your Own Dog"])
 
 with tab_overview:
     render_overview(
-        run_query_df,
-        {"dim_breeds": TABLE_DIM_BREEDS, "dim_temperament": TABLE_DIM_TEMPERAMENT},
+        query_fn,
+        tables,
         filters_clause,
         temp_clause,
     )
 
 with tab_finder:
     render_finder(
-        run_query_df,
-        {"dim_breeds": TABLE_DIM_BREEDS, "dim_temperament": TABLE_DIM_TEMPERAMENT},
+        query_fn,
+        tables,
         filters_clause,
         temp_clause,
     )